@@ -0,0 +1,24 @@
+"""
+Test Package for the Product Service
+
+Importing the service creates the database schema and this package
+applies the test configuration right after it, so both happen exactly
+once per run whichever test runner is used.
+
+The tests default to an in-memory SQLite database so that no statement
+has to make a network round-trip. Set DATABASE_URI to run them against
+PostgreSQL instead.
+"""
+import os
+import logging
+
+# NOTE: This must be set BEFORE the service is imported because importing
+# it initializes the database from the environment
+DATABASE_URI = os.environ.setdefault("DATABASE_URI", "sqlite:///:memory:")
+
+# pylint: disable=wrong-import-position
+from service import app  # noqa: E402
+
+app.config["TESTING"] = True
+app.config["DEBUG"] = False
+app.logger.setLevel(logging.CRITICAL)
@@ -21,6 +21,9 @@ import factory
 from factory.fuzzy import FuzzyChoice, FuzzyDecimal
 from service.models import Product, Category
 
+# Seed Faker and the fuzzy attributes once so every run generates the same data
+factory.random.reseed_random(42)
+
 
 class ProductFactory(factory.Factory):
     """Creates fake products for testing"""
@@ -0,0 +1,100 @@
+# Copyright 2016, 2023 John J. Rofrano. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test cases for Product deserialization
+
+These tests only build Products in memory and never touch the database,
+so they have no database fixtures of their own.
+
+Test cases can be run with:
+    nosetests tests/test_deserialize.py
+
+"""
+import unittest
+from types import MappingProxyType
+from service.models import Product, Category, DataValidationError
+
+# Read-only request payloads shared by the test cases
+VALID_DATA = MappingProxyType(
+    {
+        "name": "Test Product",
+        "description": "Test Description",
+        "price": "10.0",
+        "available": True,
+        "category": "FOOD",
+    }
+)
+INVALID_AVAILABLE = MappingProxyType(
+    {
+        "name": "Test Product",
+        "description": "A test product description",
+        "price": "19.99",
+        "available": "yes",
+        "category": "CATEGORY_NAME",
+    }
+)
+MISSING_NAME = MappingProxyType(
+    {
+        "description": "A test product description",
+        "price": "19.99",
+        "available": True,
+        "category": "CATEGORY_NAME",
+    }
+)
+MISSING_AVAILABLE_AND_CATEGORY = MappingProxyType(
+    {
+        "name": "Test Product",
+        "description": "Test Description",
+        "price": "10.0",
+    }
+)
+AVAILABLE_AS_STRING = MappingProxyType({**VALID_DATA, "available": "yes"})
+INVALID_CATEGORY = MappingProxyType({**VALID_DATA, "category": "INVALID_CATEGORY"})
+
+# Each bad payload with a regex for the error message it should produce
+BAD_DATA = (
+    (INVALID_AVAILABLE, r"Invalid type for boolean \[available\]"),
+    (MISSING_NAME, r"Invalid product: missing name"),
+    (MISSING_AVAILABLE_AND_CATEGORY, r"Invalid product: missing available"),
+    (AVAILABLE_AS_STRING, r"Invalid type for boolean \[available\]"),
+    (INVALID_CATEGORY, r"Invalid attribute: .*INVALID_CATEGORY"),
+)
+
+
+######################################################################
+#  P R O D U C T   D E S E R I A L I Z A T I O N   T E S T   C A S E S
+######################################################################
+class TestProductDeserialization(unittest.TestCase):
+    """additional class for testing the deseralization errors"""
+
+    _multiprocess_can_split_ = True
+
+    def test_deserialize_bad_data(self):
+        """It should raise a DataValidationError for each kind of bad data"""
+        for data, pattern in BAD_DATA:
+            with self.subTest(pattern=pattern):
+                product = Product()
+                with self.assertRaisesRegex(DataValidationError, pattern):
+                    product.deserialize(data)
+
+    def test_deserialize_valid_data(self):
+        """Test that deserialize() works correctly with valid data."""
+        product = Product()
+        product.deserialize(VALID_DATA)
+        self.assertEqual(product.name, "Test Product")
+        self.assertEqual(product.description, "Test Description")
+        self.assertEqual(str(product.price), "10.0")
+        self.assertEqual(product.available, True)
+        self.assertEqual(product.category, Category.FOOD)